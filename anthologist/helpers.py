@@ -1,19 +1,86 @@
+import functools
 import os
 
 
-def check_is_directory(path: str) -> bool:
+@functools.lru_cache(maxsize=1024)
+def _check_is_directory_cached(path: str) -> bool:
     return os.path.isdir(path)
 
 
+def check_is_directory(path: str) -> bool:
+    """
+    Check whether path is a directory, memoizing the result to avoid
+    repeated stat calls. Set ANTHOLOGIST_FS_CACHE=0 to disable the
+    cache (e.g. on network filesystems where staleness matters).
+    """
+    if os.environ.get("ANTHOLOGIST_FS_CACHE", "1") == "0":
+        return os.path.isdir(path)
+    return _check_is_directory_cached(path)
+
+
+def invalidate_fs_cache() -> None:
+    """
+    Flush cached directory checks. Long-running callers should call
+    this after creating or removing project directories.
+    """
+    _check_is_directory_cached.cache_clear()
+
+
+def check_is_directory_cached(entry: os.DirEntry) -> bool:
+    """
+    Directory check for a scandir entry. DirEntry.is_dir reuses the
+    d_type that readdir already returned, so on most local
+    filesystems this costs no syscall; it only falls back to stat
+    when the filesystem reports an unknown entry type.
+    """
+    return entry.is_dir(follow_symlinks=False)
+
+
+def any_project_missing(projects: list[str]) -> bool:
+    """
+    Return True as soon as any project is not a directory. Cheaper
+    than check_projects_exist when the caller only needs a yes/no
+    answer, since it stops at the first missing project.
+    """
+    return any(not check_is_directory(project) for project in projects)
+
+
 def check_projects_exist(projects: list[str]) -> list[str] | None:
     """
     Check that each project exists (is a directory). Return list of
-    projects that don't exist (or None if they all exist).
+    projects that don't exist (or None if they all exist). Projects
+    sharing a parent directory (the common monorepo layout) are
+    checked with a single scandir of the parent instead of one stat
+    per project.
     """
     # TODO: Check that projects are Poetry projects
-    not_directories = []
+    by_parent: dict[str, list[str]] = {}
     for project in projects:
-        if not check_is_directory(project):
-            not_directories.append(project)
+        parent = os.path.dirname(os.path.abspath(project))
+        by_parent.setdefault(parent, []).append(project)
+
+    missing: set[str] = set()
+    for parent, parent_projects in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                subdirectories = {
+                    entry.name for entry in entries if check_is_directory_cached(entry)
+                }
+        except OSError:
+            # Missing or unreadable parent: fall back to per-path checks
+            missing.update(
+                project
+                for project in parent_projects
+                if not check_is_directory(project)
+            )
+            continue
+        for project in parent_projects:
+            if os.path.basename(os.path.abspath(project)) in subdirectories:
+                continue
+            # Not listed as a plain directory; could still be a symlink
+            # to one, so double-check before reporting it missing
+            if not check_is_directory(project):
+                missing.add(project)
 
+    not_directories = [project for project in projects if project in missing]
     return not_directories or None
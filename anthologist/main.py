@@ -1,18 +1,96 @@
+import functools
 import logging
-import subprocess
+import os
 
 import click
 
-from anthologist.helpers import check_projects_exist
+from anthologist.helpers import any_project_missing, check_projects_exist
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+@functools.lru_cache(maxsize=1)
+def poetry_bin() -> str:
+    """
+    Resolve the poetry executable once per process. Lazy so that
+    --help and --version don't pay for the PATH walk.
+    """
+    import shutil
+
+    return shutil.which("poetry") or "poetry"
+
+
+def run_for_projects(
+    projects: tuple[str], command: tuple[str, ...], label: str, message: str, jobs: int
+) -> None:
+    """
+    Run a poetry command concurrently across projects, streaming each
+    project's output through a single printer thread so concurrent
+    writes never garble the progress bar.
+    """
+    # Imported here rather than at module level so short-lived
+    # invocations that never spawn poetry skip them entirely
+    import concurrent.futures
+    import queue
+    import subprocess
+    import threading
+
+    output: queue.Queue = queue.Queue()
+    finished = object()  # a worker finished its project
+    shutdown = object()  # all workers are done
+
+    def run_one(project: str) -> None:
+        with subprocess.Popen(
+            command,
+            cwd=project,
+            shell=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as process:
+            assert process.stdout is not None  # guaranteed by stdout=PIPE
+            for line in process.stdout:
+                output.put((project, line))
+        output.put((project, finished))
+
+    with click.progressbar(label=label, length=len(projects)) as bar:
+
+        def print_output() -> None:
+            current = None
+            while True:
+                item = output.get()
+                if item is shutdown:
+                    break
+                project, line = item
+                if line is finished:
+                    bar.update(1)
+                    continue
+                if project != current:
+                    click.secho(f"\n{message.format(project=project)}", fg="magenta")
+                    current = project
+                click.echo(line, nl=False)
+
+        printer = threading.Thread(target=print_output, daemon=True)
+        printer.start()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(projects), jobs)
+        ) as executor:
+            futures = [executor.submit(run_one, project) for project in projects]
+        output.put(shutdown)
+        printer.join()
+        for future in futures:
+            future.result()
 
 
 @click.group()
 @click.version_option()
 def cli() -> None:
-    pass
+    # Configure logging only when the CLI actually runs, so importing
+    # anthologist as a library doesn't install a handler; the guard
+    # keeps repeated invocations (e.g. in tests) idempotent
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 @cli.command()
@@ -44,6 +122,14 @@ def cli() -> None:
     required=False,
     help="do not perform install (only update the lockfile)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    required=False,
+    help="number of projects to process in parallel",
+)
 def add(
     dependency: str,
     version: str | None,
@@ -51,12 +137,13 @@ def add(
     group: str | None = None,
     optional: bool = False,
     lock: bool = False,
+    jobs: int = 1,
 ) -> None:
     """
     Add a dependency to multiple projects
     """
-    not_projects = check_projects_exist(list(projects))
-    if not_projects:
+    if any_project_missing(list(projects)):
+        not_projects = check_projects_exist(list(projects))
         click.secho(
             f"The following projects do not exist: {not_projects}",
             err=True,
@@ -84,14 +171,14 @@ def add(
     if lock:
         extra_args += ["--lock"]
 
-    with click.progressbar(
-        projects, label=f"Adding {dep}", length=len(projects)
-    ) as bar:
-        for project in bar:
-            click.secho(
-                f"\nAnthologist adding {dependency} to {project}:", fg="magenta"
-            )
-            subprocess.run(["poetry", "add", dep, *extra_args], cwd=project, shell=True)
+    cmd = (poetry_bin(), "add", dep, *extra_args)
+    run_for_projects(
+        projects,
+        cmd,
+        label=f"Adding {dep}",
+        message=f"Anthologist adding {dependency} to {{project}}:",
+        jobs=jobs,
+    )
 
 
 @cli.command()
@@ -116,12 +203,22 @@ def add(
     required=False,
     help="synchronize the environment with the locked packages",
 )
-def update(projects: tuple[str], lock: bool = False, sync: bool = False) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    required=False,
+    help="number of projects to process in parallel",
+)
+def update(
+    projects: tuple[str], lock: bool = False, sync: bool = False, jobs: int = 1
+) -> None:
     """
     Update dependencies for multiple projects
     """
-    not_projects = check_projects_exist(list(projects))
-    if not_projects:
+    if any_project_missing(list(projects)):
+        not_projects = check_projects_exist(list(projects))
         click.secho(
             f"The following projects do not exist: {not_projects}",
             err=True,
@@ -143,14 +240,14 @@ def update(projects: tuple[str], lock: bool = False, sync: bool = False) -> None
     if sync:
         extra_args += ["--sync"]
 
-    with click.progressbar(
-        projects, label="Updating dependencies", length=len(projects)
-    ) as bar:
-        for project in bar:
-            click.secho(
-                f"\nAnthologist updating dependencies for {project}:", fg="magenta"
-            )
-            subprocess.run(["poetry", "update", *extra_args], cwd=project, shell=True)
+    cmd = (poetry_bin(), "update", *extra_args)
+    run_for_projects(
+        projects,
+        cmd,
+        label="Updating dependencies",
+        message="Anthologist updating dependencies for {project}:",
+        jobs=jobs,
+    )
 
 
 @cli.command()
@@ -176,14 +273,26 @@ def update(projects: tuple[str], lock: bool = False, sync: bool = False) -> None
     required=False,
     help="do not perform operations (only update the lockfile)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    required=False,
+    help="number of projects to process in parallel",
+)
 def remove(
-    dependency: str, projects: tuple[str], group: str | None = None, lock: bool = False
+    dependency: str,
+    projects: tuple[str],
+    group: str | None = None,
+    lock: bool = False,
+    jobs: int = 1,
 ) -> None:
     """
     Remove a dependency from multiple projects
     """
-    not_projects = check_projects_exist(list(projects))
-    if not_projects:
+    if any_project_missing(list(projects)):
+        not_projects = check_projects_exist(list(projects))
         click.secho(
             f"The following projects do not exist: {not_projects}",
             err=True,
@@ -205,16 +314,14 @@ def remove(
     if lock:
         extra_args += ["--lock"]
 
-    with click.progressbar(
-        projects, label=f"Removing {dependency}", length=len(projects)
-    ) as bar:
-        for project in bar:
-            click.secho(
-                f"\nAnthologist removing {dependency} from {project}:", fg="magenta"
-            )
-            subprocess.run(
-                ["poetry", "remove", dependency, *extra_args], cwd=project, shell=True
-            )
+    cmd = (poetry_bin(), "remove", dependency, *extra_args)
+    run_for_projects(
+        projects,
+        cmd,
+        label=f"Removing {dependency}",
+        message=f"Anthologist removing {dependency} from {{project}}:",
+        jobs=jobs,
+    )
 
 
 @cli.command()
@@ -231,12 +338,20 @@ def remove(
     is_flag=True,
     help="only refresh the lock file - do not update dependencies to latest available compatible versions",
 )
-def lock(projects: tuple[str], no_update: bool) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    required=False,
+    help="number of projects to process in parallel",
+)
+def lock(projects: tuple[str], no_update: bool, jobs: int = 1) -> None:
     """
     Lock dependencies for multiple projects
     """
-    not_projects = check_projects_exist(list(projects))
-    if not_projects:
+    if any_project_missing(list(projects)):
+        not_projects = check_projects_exist(list(projects))
         click.secho(
             f"The following projects do not exist: {not_projects}",
             err=True,
@@ -252,14 +367,13 @@ def lock(projects: tuple[str], no_update: bool) -> None:
         click.secho(project, fg="magenta")
     click.secho("----------------", fg="magenta")
 
-    cmd = ["poetry", "lock"]
+    cmd: tuple[str, ...] = (poetry_bin(), "lock")
     if no_update:
-        cmd.append("--no-update")
-    with click.progressbar(
-        projects, label="Locking dependencies", length=len(projects)
-    ) as bar:
-        for project in bar:
-            click.secho(
-                f"\nAnthologist locking dependencies for {project}:", fg="magenta"
-            )
-            subprocess.run(["poetry", "lock"], cwd=project, shell=True)
+        cmd += ("--no-update",)
+    run_for_projects(
+        projects,
+        cmd,
+        label="Locking dependencies",
+        message="Anthologist locking dependencies for {project}:",
+        jobs=jobs,
+    )